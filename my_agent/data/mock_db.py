@@ -13,11 +13,14 @@ database models or external service calls. The purpose here is to facilitate
 local testing and demonstration of the smart filtering agents.
 """
 
+import heapq
+from operator import attrgetter
+from sys import intern
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, List, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Listing:
     """Base class for all listings."""
     listingId: str
@@ -29,7 +32,7 @@ class Listing:
     averageRating: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transport(Listing):
     """Represents a vehicle available for rent."""
     vehicleType: str
@@ -38,14 +41,14 @@ class Transport(Listing):
     year: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Accommodation(Listing):
     """Represents a place to stay."""
     propertyType: str
     numGuests: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Item(Listing):
     """Represents a general item available for rent."""
     itemCategory: str
@@ -126,19 +129,209 @@ mock_listings: List[Listing] = [
 ]
 
 
+# Category partitions, built once at import time so the search tools do not
+# re-scan (and re-isinstance) the whole catalogue on every call. The search
+# functions never mutate these lists – they only rebuild their own filtered
+# copies – so the getters can hand out the shared lists directly.
+_TRANSPORT: List[Transport] = []
+_ACCOMMODATION: List[Accommodation] = []
+_ITEM: List[Item] = []
+
+# Pre-lowercased searchable string columns, aligned index-for-index with the
+# partitions above (a structure-of-arrays layout). The search tools match
+# case-insensitively, so lowercasing each field once here saves a ``.lower()``
+# call per listing per filter on every search. Locations and categorical
+# fields (vehicleType, propertyType, itemCategory) are interned: they come
+# from small fixed vocabularies, so comparisons against an interned query
+# usually reduce to a pointer check.
+_TRANSPORT_LC: List[Tuple[str, str, str, str]] = []  # location, vehicleType, make, model
+_ACCOMMODATION_LC: List[Tuple[str, str]] = []  # location, propertyType
+_ITEM_LC: List[Tuple[str, str]] = []  # location, itemCategory
+
+# Lowercased locations that actually occur in the catalogue, used by the
+# query parser to validate extracted place names before filtering on them.
+_KNOWN_LOCATIONS: "set[str]" = set()
+
+# Precomputed ``listing_score`` columns, aligned index-for-index with the
+# partitions like the lowercase columns above, so the best-pick loop in each
+# search tool reads a ready-made float instead of redoing the arithmetic per
+# candidate per call.
+_TRANSPORT_SCORES: List[float] = []
+_ACCOMMODATION_SCORES: List[float] = []
+_ITEM_SCORES: List[float] = []
+
+# The no-match branch of each search tool offers at most this many
+# alternatives, so only the top of each ranking is ever kept.
+_SUGGESTION_LIMIT = 3
+
+# Per-category suggestion rankings, best-first by the shared scoring
+# heuristic and capped at ``_SUGGESTION_LIMIT`` entries. The no-match branch
+# of each search tool returns these instead of re-sorting the catalogue.
+TRANSPORT_SUGGESTIONS: List[Transport] = []
+ACCOMMODATION_SUGGESTIONS: List[Accommodation] = []
+ITEM_SUGGESTIONS: List[Item] = []
+
+# Full-catalogue aggregates, also cached at import so the no-match suggestion
+# branch of the search tools does not recompute them on every call. Read these
+# through the module (``mock_db.TRANSPORT_MAX_RATING``) rather than a
+# ``from``-import so values rebound by ``rebuild_indexes`` stay visible.
+TRANSPORT_MAX_RATING: float = 0.0
+TRANSPORT_MIN_PRICE: float = 0.0
+ACCOMMODATION_MAX_RATING: float = 0.0
+ACCOMMODATION_MIN_PRICE: float = 0.0
+ITEM_MAX_RATING: float = 0.0
+ITEM_MIN_PRICE: float = 0.0
+
+# Reason-tag thresholds shared by all search tools: a listing is tagged
+# "High Rating" when its rating reaches HIGH_RATING_MIN and is within
+# HIGH_RATING_TOLERANCE of the best rating in scope, and "Cheap" when its
+# price is within CHEAP_PRICE_TOLERANCE of the lowest.
+HIGH_RATING_MIN = 4.5
+HIGH_RATING_TOLERANCE = 0.99
+CHEAP_PRICE_TOLERANCE = 1.01
+
+# A listing within CHEAP_PRICE_TOLERANCE of the cheapest price in its category
+# earns the "Cheap" reason tag; bake the thresholds in rather than multiplying
+# per suggestion.
+TRANSPORT_CHEAP_PRICE: float = 0.0
+ACCOMMODATION_CHEAP_PRICE: float = 0.0
+ITEM_CHEAP_PRICE: float = 0.0
+
+
+# Callbacks run whenever the indexes are rebuilt, so dependants (such as the
+# agents' memoised search results) can invalidate state derived from the
+# catalogue.
+_rebuild_listeners: List[Callable[[], None]] = []
+
+
+def on_rebuild(callback: Callable[[], None]) -> None:
+    """Register a callback to run after every ``rebuild_indexes()``."""
+    _rebuild_listeners.append(callback)
+
+
+# Attribute fetchers for the aggregate passes below; attrgetter dispatches in
+# C, unlike an equivalent lambda or generator expression.
+_rating_of = attrgetter("averageRating")
+_price_of = attrgetter("basePrice")
+
+
+def listing_score(listing: Listing) -> float:
+    """Scoring heuristic shared by all search tools: high rating, low price."""
+    return listing.averageRating * 2.0 - listing.basePrice / 100.0
+
+
+def _suggestion_key(listing: Listing) -> Tuple[float, float]:
+    """Sort key for suggestion rankings: best score first, cheaper on ties."""
+    return (-listing_score(listing), _price_of(listing))
+
+
+def rebuild_indexes() -> None:
+    """Rebuild the per-category partitions and aggregates from ``mock_listings``.
+
+    Called once at import time. Tests (or demos) that mutate ``mock_listings``
+    should call this afterwards so the partitions stay in sync.
+    """
+    global TRANSPORT_MAX_RATING, TRANSPORT_MIN_PRICE, TRANSPORT_CHEAP_PRICE
+    global ACCOMMODATION_MAX_RATING, ACCOMMODATION_MIN_PRICE, ACCOMMODATION_CHEAP_PRICE
+    global ITEM_MAX_RATING, ITEM_MIN_PRICE, ITEM_CHEAP_PRICE
+    _TRANSPORT.clear()
+    _ACCOMMODATION.clear()
+    _ITEM.clear()
+    buckets = {Transport: _TRANSPORT, Accommodation: _ACCOMMODATION, Item: _ITEM}
+    for listing in mock_listings:
+        buckets[type(listing)].append(listing)
+    _TRANSPORT_LC[:] = [
+        (
+            intern(l.location.lower()),
+            intern(l.vehicleType.lower()),
+            l.make.lower(),
+            l.model.lower(),
+        )
+        for l in _TRANSPORT
+    ]
+    _ACCOMMODATION_LC[:] = [
+        (intern(l.location.lower()), intern(l.propertyType.lower()))
+        for l in _ACCOMMODATION
+    ]
+    _ITEM_LC[:] = [
+        (intern(l.location.lower()), intern(l.itemCategory.lower())) for l in _ITEM
+    ]
+    _KNOWN_LOCATIONS.clear()
+    _KNOWN_LOCATIONS.update(l.location.lower() for l in mock_listings)
+    _TRANSPORT_SCORES[:] = map(listing_score, _TRANSPORT)
+    _ACCOMMODATION_SCORES[:] = map(listing_score, _ACCOMMODATION)
+    _ITEM_SCORES[:] = map(listing_score, _ITEM)
+    TRANSPORT_SUGGESTIONS[:] = heapq.nsmallest(
+        _SUGGESTION_LIMIT, _TRANSPORT, key=_suggestion_key
+    )
+    ACCOMMODATION_SUGGESTIONS[:] = heapq.nsmallest(
+        _SUGGESTION_LIMIT, _ACCOMMODATION, key=_suggestion_key
+    )
+    ITEM_SUGGESTIONS[:] = heapq.nsmallest(_SUGGESTION_LIMIT, _ITEM, key=_suggestion_key)
+    TRANSPORT_MAX_RATING = max(map(_rating_of, _TRANSPORT), default=0.0)
+    TRANSPORT_MIN_PRICE = min(map(_price_of, _TRANSPORT), default=0.0)
+    ACCOMMODATION_MAX_RATING = max(map(_rating_of, _ACCOMMODATION), default=0.0)
+    ACCOMMODATION_MIN_PRICE = min(map(_price_of, _ACCOMMODATION), default=0.0)
+    ITEM_MAX_RATING = max(map(_rating_of, _ITEM), default=0.0)
+    ITEM_MIN_PRICE = min(map(_price_of, _ITEM), default=0.0)
+    TRANSPORT_CHEAP_PRICE = TRANSPORT_MIN_PRICE * CHEAP_PRICE_TOLERANCE
+    ACCOMMODATION_CHEAP_PRICE = ACCOMMODATION_MIN_PRICE * CHEAP_PRICE_TOLERANCE
+    ITEM_CHEAP_PRICE = ITEM_MIN_PRICE * CHEAP_PRICE_TOLERANCE
+    for callback in _rebuild_listeners:
+        callback()
+
+
+rebuild_indexes()
+
+
 def get_transport_listings() -> List[Transport]:
-    """Return a list of transport listings from the mock database."""
-    return [l for l in mock_listings if isinstance(l, Transport)]
+    """Return the list of transport listings from the mock database."""
+    return _TRANSPORT
 
 
 def get_accommodation_listings() -> List[Accommodation]:
-    """Return a list of accommodation listings from the mock database."""
-    return [l for l in mock_listings if isinstance(l, Accommodation)]
+    """Return the list of accommodation listings from the mock database."""
+    return _ACCOMMODATION
 
 
 def get_item_listings() -> List[Item]:
-    """Return a list of item listings from the mock database."""
-    return [l for l in mock_listings if isinstance(l, Item)]
+    """Return the list of item listings from the mock database."""
+    return _ITEM
+
+
+def get_transport_search_columns() -> List[Tuple[str, str, str, str]]:
+    """Return the lowercased (location, vehicleType, make, model) columns."""
+    return _TRANSPORT_LC
+
+
+def get_known_locations() -> "set[str]":
+    """Return the lowercased locations present in the catalogue."""
+    return _KNOWN_LOCATIONS
+
+
+def get_transport_scores() -> List[float]:
+    """Return the precomputed score column for transport listings."""
+    return _TRANSPORT_SCORES
+
+
+def get_accommodation_scores() -> List[float]:
+    """Return the precomputed score column for accommodation listings."""
+    return _ACCOMMODATION_SCORES
+
+
+def get_item_scores() -> List[float]:
+    """Return the precomputed score column for item listings."""
+    return _ITEM_SCORES
+
+
+def get_accommodation_search_columns() -> List[Tuple[str, str]]:
+    """Return the lowercased (location, propertyType) columns."""
+    return _ACCOMMODATION_LC
+
+
+def get_item_search_columns() -> List[Tuple[str, str]]:
+    """Return the lowercased (location, itemCategory) columns."""
+    return _ITEM_LC
 
 
 __all__ = [
@@ -147,7 +340,32 @@ __all__ = [
     "Accommodation",
     "Item",
     "mock_listings",
+    "rebuild_indexes",
+    "on_rebuild",
+    "listing_score",
+    "TRANSPORT_SUGGESTIONS",
+    "ACCOMMODATION_SUGGESTIONS",
+    "ITEM_SUGGESTIONS",
+    "TRANSPORT_MAX_RATING",
+    "TRANSPORT_MIN_PRICE",
+    "ACCOMMODATION_MAX_RATING",
+    "ACCOMMODATION_MIN_PRICE",
+    "ITEM_MAX_RATING",
+    "ITEM_MIN_PRICE",
+    "HIGH_RATING_MIN",
+    "HIGH_RATING_TOLERANCE",
+    "CHEAP_PRICE_TOLERANCE",
+    "TRANSPORT_CHEAP_PRICE",
+    "ACCOMMODATION_CHEAP_PRICE",
+    "ITEM_CHEAP_PRICE",
     "get_transport_listings",
     "get_accommodation_listings",
     "get_item_listings",
+    "get_transport_search_columns",
+    "get_accommodation_search_columns",
+    "get_item_search_columns",
+    "get_known_locations",
+    "get_transport_scores",
+    "get_accommodation_scores",
+    "get_item_scores",
 ]
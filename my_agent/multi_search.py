@@ -0,0 +1,39 @@
+"""
+multi_search.py
+---------------
+
+Combined search across all three listing categories. Multi-category requests
+('a car and a room in KL') used to be bounced back to the user to pick one
+category, and each chosen category cost a serial delegation to a specialist
+agent — one LLM round-trip per category. The search tools themselves are
+local and cheap, so this module batches them: one tool call parses the
+request per category and runs all three searches side by side.
+"""
+
+from typing import Any, Dict
+
+from .subagents.transport_agent import search_transport_by_query
+from .subagents.accommodation_agent import search_accommodation_by_query
+from .subagents.item_agent import search_item_by_query
+
+
+def search_all_categories(query: str) -> Dict[str, Any]:
+    """Search transport, accommodation and item listings in one batch.
+
+    Runs the deterministic by-query search of every specialist on the same
+    request, so a multi-category question is answered with a single tool call
+    instead of serial transfers between sub-agents.
+
+    Args:
+        query: The user's request, e.g. 'a car and an apartment in KL'.
+
+    Returns:
+        A dictionary with 'transport', 'accommodation' and 'items' keys, each
+        holding the same result shape as the corresponding category search
+        (a best match, or an error with suggestions).
+    """
+    return {
+        "transport": search_transport_by_query(query),
+        "accommodation": search_accommodation_by_query(query),
+        "items": search_item_by_query(query),
+    }
@@ -0,0 +1,95 @@
+"""
+prompt_cache.py
+---------------
+
+Implements a small response cache that sits in front of the root agent's
+model calls. Many turns sent to the coordinator are near-duplicates
+(greetings, small talk, repeated category requests), so answering them from a
+cache skips an LLM round-trip entirely.
+
+Prompts are keyed by a normalised form of the latest user message (lowercase,
+punctuation stripped, whitespace collapsed), which folds trivially different
+phrasings such as 'Hi!' and 'hi' onto the same entry. Only plain-text
+responses are cached; responses that carry function calls (tool invocations or
+agent transfers) depend on live state and are always recomputed.
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+
+# Upper bound on cached prompts; the oldest entry is evicted beyond this.
+_MAX_ENTRIES = 128
+
+_response_cache: "OrderedDict[str, LlmResponse]" = OrderedDict()
+
+# Key of the request currently in flight, set by ``check_prompt_cache`` so the
+# paired ``store_prompt_response`` callback knows where to file the response.
+_pending_key: Optional[str] = None
+
+
+def normalize_prompt(text: str) -> str:
+    """Reduce a prompt to a canonical cache key.
+
+    Lowercases the text, drops punctuation and collapses runs of whitespace so
+    that cosmetic variations of the same message share one cache entry.
+    """
+    cleaned = "".join(c if c.isalnum() or c.isspace() else " " for c in text.lower())
+    return " ".join(cleaned.split())
+
+
+def last_user_text(llm_request: LlmRequest) -> Optional[str]:
+    """Extract the text of the most recent user message, if there is one."""
+    for content in reversed(llm_request.contents or []):
+        if content.role == "user":
+            parts = [p.text for p in content.parts or [] if p.text]
+            return " ".join(parts) if parts else None
+    return None
+
+
+def check_prompt_cache(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """``before_model_callback``: serve a cached response for a known prompt.
+
+    Returning an ``LlmResponse`` makes the ADK skip the model call for this
+    turn; returning ``None`` lets the request proceed as normal.
+    """
+    global _pending_key
+    _pending_key = None
+    text = last_user_text(llm_request)
+    if not text:
+        return None
+    key = normalize_prompt(text)
+    cached = _response_cache.get(key)
+    if cached is not None:
+        _response_cache.move_to_end(key)
+        return cached
+    _pending_key = key
+    return None
+
+
+def store_prompt_response(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> Optional[LlmResponse]:
+    """``after_model_callback``: remember plain-text responses for reuse.
+
+    Responses containing function calls are not cached because tool results
+    and agent transfers depend on live conversation state.
+    """
+    global _pending_key
+    key = _pending_key
+    _pending_key = None
+    if key is None:
+        return None
+    content = llm_response.content
+    if content is None or not content.parts:
+        return None
+    if any(p.function_call for p in content.parts):
+        return None
+    _response_cache[key] = llm_response
+    while len(_response_cache) > _MAX_ENTRIES:
+        _response_cache.popitem(last=False)
+    return None
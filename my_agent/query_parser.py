@@ -0,0 +1,143 @@
+"""
+query_parser.py
+---------------
+
+Deterministic extraction of search parameters from free-text rental requests.
+The specialist agents originally relied on the LLM to pull location, price and
+category filters out of the user's message before calling their search tools —
+an extra model round-trip per query. The patterns here cover the common
+phrasings ('a car in KL for under 100', 'an apartment for 3 people') with
+precompiled regular expressions instead, so a request can go from raw text to
+a database search without the LLM in the middle. Anything the patterns miss is
+simply left unset and the search runs with the filters that were found.
+"""
+
+import re
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from .data import mock_db
+
+# 'under 100', 'below RM 80', 'less than 150.50', 'budget of 200', ...
+_MAX_PRICE_RE = re.compile(
+    r"(?:under|below|less\s+than|at\s+most|within|max(?:imum)?(?:\s+of)?|"
+    r"budget(?:\s+of)?)\s*(?:rm\s*)?(\d+(?:\.\d+)?)",
+    re.IGNORECASE,
+)
+
+# 'in Kuala Lumpur', 'near Penang'. Candidates are taken as a run of
+# capitalised words after the preposition and then validated against the
+# locations that actually occur in the catalogue (see ``_extract_location``),
+# so verbs, articles and unknown place names are never used as filters.
+_LOCATION_RE = re.compile(
+    r"\b(?:in|at|near|around)\s+((?:[A-Z][A-Za-z]*)(?:\s+[A-Z][A-Za-z]*)*)"
+)
+
+# Plausible model years for a rental vehicle.
+_YEAR_RE = re.compile(r"\b(19[5-9]\d|20[0-4]\d)\b")
+
+# 'for 3 people', 'sleeps 6', 'fits 4 pax'.
+_NUM_GUESTS_RE = re.compile(
+    r"\b(?:for|fits?|sleeps?|accommodates?)\s+(\d{1,2})\s*"
+    r"(?:people|persons?|guests?|pax)\b",
+    re.IGNORECASE,
+)
+
+# Keyword vocabularies for the categorical filters, mapped onto the values
+# used in the mock catalogue.
+_VEHICLE_TYPE_KEYWORDS: Tuple[Tuple[str, FrozenSet[str]], ...] = (
+    ("car", frozenset(("car", "cars", "sedan", "suv", "hatchback"))),
+    ("motorcycle", frozenset(("motorcycle", "motorbike", "bike", "scooter"))),
+    ("van", frozenset(("van", "vans", "minivan"))),
+    ("truck", frozenset(("truck", "lorry", "pickup"))),
+)
+_PROPERTY_TYPE_KEYWORDS: Tuple[Tuple[str, FrozenSet[str]], ...] = (
+    ("apartment", frozenset(("apartment", "apartments", "flat", "condo", "studio"))),
+    ("house", frozenset(("house", "houses", "home", "bungalow", "villa"))),
+)
+_ITEM_CATEGORY_KEYWORDS: Tuple[Tuple[str, FrozenSet[str]], ...] = (
+    (
+        "Electronics",
+        frozenset(
+            ("camera", "cameras", "laptop", "laptops", "projector", "drone", "electronics")
+        ),
+    ),
+    ("Tools", frozenset(("drill", "drills", "saw", "ladder", "tool", "tools"))),
+)
+
+
+def _match_keyword(
+    words: "set[str]", vocabulary: Tuple[Tuple[str, FrozenSet[str]], ...]
+) -> Optional[str]:
+    """Return the first vocabulary value whose keywords appear in ``words``."""
+    for value, keywords in vocabulary:
+        if not words.isdisjoint(keywords):
+            return value
+    return None
+
+
+def _extract_location(query: str) -> Optional[str]:
+    """Pull a location out of ``query`` if the catalogue knows it.
+
+    A candidate only becomes a filter when it matches a catalogue location the
+    same way the search tools do (case-insensitive substring); anything else —
+    unknown cities, abbreviations like 'KL', mis-captured words — is left
+    unset so the search is not narrowed to an empty result.
+    """
+    match = _LOCATION_RE.search(query)
+    if match is None:
+        return None
+    candidate = match.group(1)
+    candidate_l = candidate.lower()
+    if any(candidate_l in known for known in mock_db.get_known_locations()):
+        return candidate
+    return None
+
+
+def _extract_price(query: str) -> Tuple[Optional[float], str]:
+    """Pull a maximum price out of ``query``.
+
+    Returns the price (or ``None``) together with the query text with the
+    price phrase removed, so number-based patterns such as the year matcher
+    cannot rematch the same digits.
+    """
+    match = _MAX_PRICE_RE.search(query)
+    if match is None:
+        return None, query
+    return float(match.group(1)), query[: match.start()] + query[match.end() :]
+
+
+def parse_transport_query(query: str) -> Dict[str, Any]:
+    """Extract transport search filters from a free-text request."""
+    max_price, remainder = _extract_price(query)
+    year_match = _YEAR_RE.search(remainder)
+    words = set(re.findall(r"[a-z]+", query.lower()))
+    return {
+        "location": _extract_location(query),
+        "max_price": max_price,
+        "vehicle_type": _match_keyword(words, _VEHICLE_TYPE_KEYWORDS),
+        "year": int(year_match.group(1)) if year_match else None,
+    }
+
+
+def parse_accommodation_query(query: str) -> Dict[str, Any]:
+    """Extract accommodation search filters from a free-text request."""
+    max_price, _ = _extract_price(query)
+    guests_match = _NUM_GUESTS_RE.search(query)
+    words = set(re.findall(r"[a-z]+", query.lower()))
+    return {
+        "location": _extract_location(query),
+        "max_price": max_price,
+        "property_type": _match_keyword(words, _PROPERTY_TYPE_KEYWORDS),
+        "num_guests": int(guests_match.group(1)) if guests_match else None,
+    }
+
+
+def parse_item_query(query: str) -> Dict[str, Any]:
+    """Extract item search filters from a free-text request."""
+    max_price, _ = _extract_price(query)
+    words = set(re.findall(r"[a-z]+", query.lower()))
+    return {
+        "location": _extract_location(query),
+        "max_price": max_price,
+        "item_category": _match_keyword(words, _ITEM_CATEGORY_KEYWORDS),
+    }
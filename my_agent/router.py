@@ -0,0 +1,115 @@
+"""
+router.py
+---------
+
+Deterministic pre-routing for the root agent. Two classes of message do not
+need an LLM to handle at all: plain greetings (the coordinator always answers
+them with the same prompt for requirements) and messages that name exactly one
+rental category (the coordinator always delegates them to the matching
+specialist). A ``before_model_callback`` matches these with precompiled
+regular expressions and short-circuits the model call, replying or
+transferring directly. Anything ambiguous falls through to the LLM as before.
+"""
+
+import re
+from typing import Optional, Tuple
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+
+from .prompt_cache import last_user_text
+from .prompts import REQUIREMENTS_PROMPT
+
+# Canned reply for greetings, shared with rule 1 of the root agent's
+# instruction so the two cannot drift apart.
+GREETING_REPLY = REQUIREMENTS_PROMPT
+
+# A message that is nothing but a greeting or pleasantry.
+_GREETING_RE = re.compile(
+    r"^(hi|hiya|hello|hey|yo|good\s+(morning|afternoon|evening)|"
+    r"how\s+are\s+you|thanks|thank\s+you)[\s!.,?]*$",
+    re.IGNORECASE,
+)
+
+# Keyword patterns per specialist agent, mirroring the category examples in
+# the root agent's instruction. Order matches the sub-agent declaration order.
+_CATEGORY_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    (
+        "TransportAgent",
+        re.compile(
+            r"\b(car|cars|bike|bikes|motorcycle|van|vans|truck|scooter|vehicle|vehicles)\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "AccommodationAgent",
+        re.compile(
+            r"\b(room|rooms|apartment|apartments|hotel|hotels|house|houses|"
+            r"homestay|condo|accommodation)\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "ItemAgent",
+        re.compile(
+            r"\b(camera|cameras|laptop|laptops|tool|tools|drill|projector|"
+            r"item|items|equipment)\b",
+            re.IGNORECASE,
+        ),
+    ),
+)
+
+
+def match_category(text: str) -> Optional[str]:
+    """Return the specialist agent for ``text`` if exactly one category matches.
+
+    Messages matching several categories (or none) return ``None`` so the LLM
+    can ask for clarification as usual.
+    """
+    matched = [name for name, pattern in _CATEGORY_PATTERNS if pattern.search(text)]
+    if len(matched) == 1:
+        return matched[0]
+    return None
+
+
+def _text_response(text: str) -> LlmResponse:
+    """Build a plain-text model response."""
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)])
+    )
+
+
+def _transfer_response(agent_name: str) -> LlmResponse:
+    """Build a response that transfers control to ``agent_name``."""
+    return LlmResponse(
+        content=types.Content(
+            role="model",
+            parts=[
+                types.Part(
+                    function_call=types.FunctionCall(
+                        name="transfer_to_agent", args={"agent_name": agent_name}
+                    )
+                )
+            ],
+        )
+    )
+
+
+def route_before_model(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """``before_model_callback``: handle unambiguous messages without the LLM.
+
+    Greetings get the canned requirements prompt; messages naming exactly one
+    rental category are transferred straight to the matching specialist.
+    """
+    text = last_user_text(llm_request)
+    if not text:
+        return None
+    if _GREETING_RE.match(text.strip()):
+        return _text_response(GREETING_REPLY)
+    agent_name = match_category(text)
+    if agent_name is not None:
+        return _transfer_response(agent_name)
+    return None
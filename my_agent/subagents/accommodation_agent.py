@@ -9,11 +9,43 @@ best match based on user criteria. The associated LlmAgent interprets
 queries and calls the search tool when needed.
 """
 
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from copy import deepcopy
+from sys import intern
+from typing import Optional, Dict, Any, List, Tuple
 
 from google.adk.agents import LlmAgent
 
-from ..data.mock_db import get_accommodation_listings, Accommodation
+from ..data import mock_db
+from ..data.mock_db import (
+    get_accommodation_listings,
+    get_accommodation_search_columns,
+    get_accommodation_scores,
+    CHEAP_PRICE_TOLERANCE,
+    HIGH_RATING_MIN,
+    HIGH_RATING_TOLERANCE,
+    Accommodation,
+)
+from ..prompts import ACCOMMODATION_INSTRUCTION
+from ..query_parser import parse_accommodation_query
+
+# Search results are deterministic for a given argument tuple while the
+# catalogue is static, so memoise them. The keys are arbitrary LLM-supplied
+# argument tuples, so the cache is bounded with least-recently-used eviction;
+# entries are stored and returned as copies so a caller mutating a result
+# cannot corrupt the cache. The cache is dropped whenever the mock data is
+# rebuilt.
+_SEARCH_CACHE_MAX = 512
+_search_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+mock_db.on_rebuild(_search_cache.clear)
+
+
+def _remember(cache_key: tuple, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache a copy of ``result``, evicting the oldest entry beyond the bound."""
+    _search_cache[cache_key] = deepcopy(result)
+    while len(_search_cache) > _SEARCH_CACHE_MAX:
+        _search_cache.popitem(last=False)
+    return result
 
 
 def search_accommodation_listings(
@@ -31,39 +63,53 @@ def search_accommodation_listings(
     Args:
         location: Desired city or neighbourhood.
         max_price: Maximum acceptable rental price.
-        property_type: Type of property (e.g. Apartment, House).
+        property_type: Type of property (e.g. Apartment, House); matched
+            exactly, ignoring case.
         num_guests: Minimum number of guests the place must accommodate.
 
     Returns:
         A dictionary with keys 'listingId', 'title', 'location', 'basePrice'
         and 'reason', or an 'error' key if no result is found.
     """
-    candidates: List[Accommodation] = get_accommodation_listings()
-    if location:
-        candidates = [l for l in candidates if location.lower() in l.location.lower()]
-    if max_price is not None:
-        candidates = [l for l in candidates if l.basePrice <= max_price]
-    if property_type:
-        candidates = [l for l in candidates if property_type.lower() in l.propertyType.lower()]
-    if num_guests:
-        candidates = [l for l in candidates if l.numGuests >= num_guests]
-    if not candidates:
-        # No exact matches – prepare suggestions from the full accommodation list
-        all_listings: List[Accommodation] = get_accommodation_listings()
-        suggestions_sorted = sorted(
-            all_listings,
-            key=lambda l: (-(l.averageRating * 2.0 - l.basePrice / 100.0), l.basePrice),
+    cache_key = (location, max_price, property_type, num_guests)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        _search_cache.move_to_end(cache_key)
+        return deepcopy(cached)
+    # Lowercase the user-supplied filter strings once, outside the loop;
+    # interning the location lets the common whole-city match hit the
+    # identity fast path before falling back to the substring check
+    location_l = intern(location.lower()) if location else None
+    # Categorical filters are interned so equality is usually a pointer check
+    property_type_l = intern(property_type.lower()) if property_type else None
+    # Apply all active filters in a single pass; string matching runs against
+    # the pre-lowercased columns kept alongside the partition.
+    candidates: List[Tuple[Accommodation, float]] = [
+        (l, score)
+        for l, (loc_lc, property_lc), score in zip(
+            get_accommodation_listings(), get_accommodation_search_columns(), get_accommodation_scores()
         )
-        suggestions = suggestions_sorted[:3]
+        if (location_l is None or location_l is loc_lc or location_l in loc_lc)
+        and (max_price is None or l.basePrice <= max_price)
+        and (property_type_l is None or property_type_l == property_lc)
+        and (not num_guests or l.numGuests >= num_guests)
+    ]
+    if not candidates:
+        # No exact matches – offer the precomputed top suggestions for the
+        # category (ranked by the shared scoring heuristic)
+        suggestions = mock_db.ACCOMMODATION_SUGGESTIONS
         suggestion_data = []
         if suggestions:
-            max_rating_all = max(l.averageRating for l in all_listings)
-            min_price_all = min(l.basePrice for l in all_listings)
+            max_rating_all = mock_db.ACCOMMODATION_MAX_RATING
+            cheap_price = mock_db.ACCOMMODATION_CHEAP_PRICE
             for s in suggestions:
                 tag = "Related"
-                if s.averageRating >= 4.5 and s.averageRating >= 0.99 * max_rating_all:
+                if (
+                    s.averageRating >= HIGH_RATING_MIN
+                    and s.averageRating >= HIGH_RATING_TOLERANCE * max_rating_all
+                ):
                     tag = "High Rating"
-                elif s.basePrice <= min_price_all * 1.01:
+                elif s.basePrice <= cheap_price:
                     tag = "Cheap"
                 suggestion_data.append(
                     {
@@ -74,52 +120,65 @@ def search_accommodation_listings(
                         "reason": tag,
                     }
                 )
-        return {
+        result = {
             "error": "No matching accommodation listings found.",
             "suggestions": suggestion_data,
         }
+        return _remember(cache_key, result)
     best: Optional[Accommodation] = None
     best_score = float("-inf")
-    max_rating = max(l.averageRating for l in candidates)
-    for listing in candidates:
-        score = listing.averageRating * 2.0 - listing.basePrice / 100.0
+    # Track the highest rating in the same pass that picks the best listing
+    max_rating = float("-inf")
+    for listing, score in candidates:
+        if listing.averageRating > max_rating:
+            max_rating = listing.averageRating
         if score > best_score:
             best_score = score
             best = listing
     reason = "Best Match"
     if best:
-        if best.averageRating >= 4.5 and best.averageRating >= 0.99 * max_rating:
+        if (
+            best.averageRating >= HIGH_RATING_MIN
+            and best.averageRating >= HIGH_RATING_TOLERANCE * max_rating
+        ):
             reason = "High Rating"
         else:
-            min_price = min(l.basePrice for l in candidates)
-            if best.basePrice <= min_price * 1.01:
+            min_price = min(l.basePrice for l, _ in candidates)
+            if best.basePrice <= min_price * CHEAP_PRICE_TOLERANCE:
                 reason = "Cheap"
-    return {
+    result = {
         "listingId": best.listingId,
         "title": best.title,
         "location": best.location,
         "basePrice": best.basePrice,
         "reason": reason,
     }
+    return _remember(cache_key, result)
+
+
+def search_accommodation_by_query(query: str) -> Dict[str, Any]:
+    """Search for the best accommodation described in free text.
+
+    Extracts location, maximum price, property type and guest count from the
+    request deterministically (see ``query_parser``) and runs the same search
+    as ``search_accommodation_listings``, so no extra LLM step is needed to
+    pull the parameters apart.
+
+    Args:
+        query: The user's request, e.g. 'an apartment for 3 people in KL'.
+
+    Returns:
+        The same dictionary as ``search_accommodation_listings``.
+    """
+    return search_accommodation_listings(**parse_accommodation_query(query))
 
 
 accommodation_agent = LlmAgent(
     model="gemini-2.0-flash",
     name="AccommodationAgent",
     description="Agent specialised in finding accommodation listings",
-    instruction=(
-        "You are an agent that helps users find the best **accommodation** (place to stay) based on their requirements.\n"
-        "When the user describes what they need (e.g. 'an apartment for 3 people in KL'), follow these steps:\n"
-        "1. Extract relevant search parameters: location (city or neighbourhood), maximum price, property type (apartment, house, etc.), and number of guests.\n"
-        "2. Call the `search_accommodation_listings` tool with these parameters to retrieve the best match.\n"
-        "3. If a listing is found, summarise the recommendation with its title, location, price, and a short reason tag in parentheses (e.g., Cheap or High Rating).\n"
-        "4. If no listing matches the criteria, apologise and then present some alternative accommodation options from the suggestions returned by the tool. "
-        "Include each suggestion's title, location, price and reason tag (e.g., High Rating or Cheap).\n"
-        "Do not handle requests outside of accommodations yourself. If the user asks about vehicles or other items instead of lodging, "
-        "delegate the conversation by calling `transfer_to_agent` with 'TransportAgent' for vehicles or 'ItemAgent' for items. "
-        "This way, the user will be passed to the correct agent."
-    ),
-    tools=[search_accommodation_listings],
+    instruction=ACCOMMODATION_INSTRUCTION,
+    tools=[search_accommodation_by_query, search_accommodation_listings],
 )
 
 
@@ -8,11 +8,45 @@ search function that queries the mock database for item listings and returns
 the best match. The LlmAgent uses this function to fulfil user queries.
 """
 
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from copy import deepcopy
+from sys import intern
+from typing import Optional, Dict, Any, List, Tuple
 
 from google.adk.agents import LlmAgent
 
-from ..data.mock_db import get_item_listings, Item
+from ..data import mock_db
+from ..data.mock_db import (
+    get_item_listings,
+    get_item_search_columns,
+    get_item_scores,
+    CHEAP_PRICE_TOLERANCE,
+    HIGH_RATING_MIN,
+    HIGH_RATING_TOLERANCE,
+    Item,
+)
+from ..prompts import ITEM_INSTRUCTION
+from ..query_parser import parse_item_query
+
+# Search results are deterministic for a given argument tuple while the
+# catalogue is static, so memoise them. The keys are arbitrary LLM-supplied
+# argument tuples, so the cache is bounded with least-recently-used eviction;
+# entries are stored and returned as copies so a caller mutating a result
+# cannot corrupt the cache. The cache is dropped whenever the mock data is
+# rebuilt.
+_SEARCH_CACHE_MAX = 512
+_search_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+mock_db.on_rebuild(_search_cache.clear)
+
+
+def _remember(cache_key: tuple, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache a copy of ``result``, evicting the oldest entry beyond the bound."""
+    _search_cache[cache_key] = deepcopy(result)
+    while len(_search_cache) > _SEARCH_CACHE_MAX:
+        _search_cache.popitem(last=False)
+    return result
+
+
 def search_item_listings(
     location: Optional[str] = None,
     max_price: Optional[float] = None,
@@ -27,36 +61,51 @@ def search_item_listings(
     Args:
         location: Desired city or area.
         max_price: Maximum acceptable rental price.
-        item_category: Category of item (e.g. Electronics, Tools).
+        item_category: Category of item (e.g. Electronics, Tools); matched
+            exactly, ignoring case.
 
     Returns:
         A dictionary with keys 'listingId', 'title', 'location', 'basePrice'
         and 'reason', or an 'error' key if no result is found.
     """
-    candidates: List[Item] = get_item_listings()
-    if location:
-        candidates = [l for l in candidates if location.lower() in l.location.lower()]
-    if max_price is not None:
-        candidates = [l for l in candidates if l.basePrice <= max_price]
-    if item_category:
-        candidates = [l for l in candidates if item_category.lower() in l.itemCategory.lower()]
-    if not candidates:
-        # No exact matches – prepare suggestions from the full item list
-        all_listings: List[Item] = get_item_listings()
-        suggestions_sorted = sorted(
-            all_listings,
-            key=lambda l: (-(l.averageRating * 2.0 - l.basePrice / 100.0), l.basePrice),
+    cache_key = (location, max_price, item_category)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        _search_cache.move_to_end(cache_key)
+        return deepcopy(cached)
+    # Lowercase the user-supplied filter strings once, outside the loop;
+    # interning the location lets the common whole-city match hit the
+    # identity fast path before falling back to the substring check
+    location_l = intern(location.lower()) if location else None
+    # Categorical filters are interned so equality is usually a pointer check
+    item_category_l = intern(item_category.lower()) if item_category else None
+    # Apply all active filters in a single pass; string matching runs against
+    # the pre-lowercased columns kept alongside the partition.
+    candidates: List[Tuple[Item, float]] = [
+        (l, score)
+        for l, (loc_lc, category_lc), score in zip(
+            get_item_listings(), get_item_search_columns(), get_item_scores()
         )
-        suggestions = suggestions_sorted[:3]
+        if (location_l is None or location_l is loc_lc or location_l in loc_lc)
+        and (max_price is None or l.basePrice <= max_price)
+        and (item_category_l is None or item_category_l == category_lc)
+    ]
+    if not candidates:
+        # No exact matches – offer the precomputed top suggestions for the
+        # category (ranked by the shared scoring heuristic)
+        suggestions = mock_db.ITEM_SUGGESTIONS
         suggestion_data = []
         if suggestions:
-            max_rating_all = max(l.averageRating for l in all_listings)
-            min_price_all = min(l.basePrice for l in all_listings)
+            max_rating_all = mock_db.ITEM_MAX_RATING
+            cheap_price = mock_db.ITEM_CHEAP_PRICE
             for s in suggestions:
                 tag = "Related"
-                if s.averageRating >= 4.5 and s.averageRating >= 0.99 * max_rating_all:
+                if (
+                    s.averageRating >= HIGH_RATING_MIN
+                    and s.averageRating >= HIGH_RATING_TOLERANCE * max_rating_all
+                ):
                     tag = "High Rating"
-                elif s.basePrice <= min_price_all * 1.01:
+                elif s.basePrice <= cheap_price:
                     tag = "Cheap"
                 suggestion_data.append(
                     {
@@ -67,50 +116,63 @@ def search_item_listings(
                         "reason": tag,
                     }
                 )
-        return {
+        result = {
             "error": "No matching item listings found.",
             "suggestions": suggestion_data,
         }
+        return _remember(cache_key, result)
     best: Optional[Item] = None
     best_score = float("-inf")
-    max_rating = max(l.averageRating for l in candidates)
-    for listing in candidates:
-        score = listing.averageRating * 2.0 - listing.basePrice / 100.0
+    # Track the highest rating in the same pass that picks the best listing
+    max_rating = float("-inf")
+    for listing, score in candidates:
+        if listing.averageRating > max_rating:
+            max_rating = listing.averageRating
         if score > best_score:
             best_score = score
             best = listing
     reason = "Best Match"
     if best:
-        if best.averageRating >= 4.5 and best.averageRating >= 0.99 * max_rating:
+        if (
+            best.averageRating >= HIGH_RATING_MIN
+            and best.averageRating >= HIGH_RATING_TOLERANCE * max_rating
+        ):
             reason = "High Rating"
         else:
-            min_price = min(l.basePrice for l in candidates)
-            if best.basePrice <= min_price * 1.01:
+            min_price = min(l.basePrice for l, _ in candidates)
+            if best.basePrice <= min_price * CHEAP_PRICE_TOLERANCE:
                 reason = "Cheap"
-    return {
+    result = {
         "listingId": best.listingId,
         "title": best.title,
         "location": best.location,
         "basePrice": best.basePrice,
         "reason": reason,
     }
+    return _remember(cache_key, result)
+
+
+def search_item_by_query(query: str) -> Dict[str, Any]:
+    """Search for the best rental item described in free text.
+
+    Extracts location, maximum price and item category from the request
+    deterministically (see ``query_parser``) and runs the same search as
+    ``search_item_listings``, so no extra LLM step is needed to pull the
+    parameters apart.
+
+    Args:
+        query: The user's request, e.g. 'rent a DSLR camera in KL'.
+
+    Returns:
+        The same dictionary as ``search_item_listings``.
+    """
+    return search_item_listings(**parse_item_query(query))
 
 
 item_agent = LlmAgent(
     model="gemini-2.0-flash",
     name="ItemAgent",
     description="Agent specialised in finding rental items",
-    instruction=(
-        "You are an agent that helps users find the best **item** to rent based on their requirements.\n"
-        "When the user describes what they need (e.g. 'rent a DSLR camera in KL'), follow these steps:\n"
-        "1. Extract search parameters from the request: the category of item (e.g., Electronics, Furniture), location, and maximum price if provided.\n"
-        "2. Use the `search_item_listings` tool with the extracted filters to find the most suitable item.\n"
-        "3. If a listing is found, reply with the item's title, location, price and a short reason tag such as Cheap or High Rating.\n"
-        "4. If no item matches, apologise and then offer some alternative item options from the suggestions returned by the tool. "
-        "List each suggestion with its title, location, price and reason tag (e.g., High Rating or Cheap).\n"
-        "Do not answer questions outside of item rentals yourself. If the user asks about vehicles or accommodation instead of items, "
-        "delegate the conversation by calling `transfer_to_agent` with 'TransportAgent' for vehicles or 'AccommodationAgent' for lodging. "
-        "This ensures the user is redirected to the proper specialist."
-    ),
-    tools=[search_item_listings],
+    instruction=ITEM_INSTRUCTION,
+    tools=[search_item_by_query, search_item_listings],
 )
\ No newline at end of file
@@ -13,11 +13,43 @@ Google's LlmAgent class to interpret queries and decide when to call its
 search tool.
 """
 
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from copy import deepcopy
+from sys import intern
+from typing import Optional, Dict, Any, List, Tuple
 
 from google.adk.agents import LlmAgent
 
-from ..data.mock_db import get_transport_listings, Transport
+from ..data import mock_db
+from ..data.mock_db import (
+    get_transport_listings,
+    get_transport_search_columns,
+    get_transport_scores,
+    CHEAP_PRICE_TOLERANCE,
+    HIGH_RATING_MIN,
+    HIGH_RATING_TOLERANCE,
+    Transport,
+)
+from ..prompts import TRANSPORT_INSTRUCTION
+from ..query_parser import parse_transport_query
+
+# Search results are deterministic for a given argument tuple while the
+# catalogue is static, so memoise them. The keys are arbitrary LLM-supplied
+# argument tuples, so the cache is bounded with least-recently-used eviction;
+# entries are stored and returned as copies so a caller mutating a result
+# cannot corrupt the cache. The cache is dropped whenever the mock data is
+# rebuilt.
+_SEARCH_CACHE_MAX = 512
+_search_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+mock_db.on_rebuild(_search_cache.clear)
+
+
+def _remember(cache_key: tuple, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache a copy of ``result``, evicting the oldest entry beyond the bound."""
+    _search_cache[cache_key] = deepcopy(result)
+    while len(_search_cache) > _SEARCH_CACHE_MAX:
+        _search_cache.popitem(last=False)
+    return result
 
 
 def search_transport_listings(
@@ -37,7 +69,8 @@ def search_transport_listings(
     Args:
         location: Desired city or area.
         max_price: Maximum acceptable rental price.
-        vehicle_type: Type of vehicle (e.g. car, motorcycle).
+        vehicle_type: Type of vehicle (e.g. car, motorcycle); matched exactly,
+            ignoring case.
         make: Vehicle make (e.g. Toyota).
         model: Vehicle model (e.g. Camry).
         year: Desired year of manufacture.
@@ -46,42 +79,53 @@ def search_transport_listings(
         A dictionary with keys 'listingId', 'title', 'location', 'basePrice'
         and 'reason', or an 'error' key if no result is found.
     """
-    candidates: List[Transport] = get_transport_listings()
-    # Apply filters conditionally
-    if location:
-        candidates = [l for l in candidates if location.lower() in l.location.lower()]
-    if max_price is not None:
-        candidates = [l for l in candidates if l.basePrice <= max_price]
-    if vehicle_type:
-        candidates = [l for l in candidates if vehicle_type.lower() in l.vehicleType.lower()]
-    if make:
-        candidates = [l for l in candidates if make.lower() in l.make.lower()]
-    if model:
-        candidates = [l for l in candidates if model.lower() in l.model.lower()]
-    if year:
-        candidates = [l for l in candidates if l.year == year]
+    cache_key = (location, max_price, vehicle_type, make, model, year)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        _search_cache.move_to_end(cache_key)
+        return deepcopy(cached)
+    # Lowercase the user-supplied filter strings once, outside the loop;
+    # interning the location lets the common whole-city match hit the
+    # identity fast path before falling back to the substring check
+    location_l = intern(location.lower()) if location else None
+    # Categorical filters are interned so equality is usually a pointer check
+    vehicle_type_l = intern(vehicle_type.lower()) if vehicle_type else None
+    make_l = make.lower() if make else None
+    model_l = model.lower() if model else None
+    # Apply all active filters in a single pass, short-circuiting on the first
+    # failing predicate. String matching runs against the pre-lowercased
+    # columns kept alongside the partition, so no per-listing .lower() calls.
+    candidates: List[Tuple[Transport, float]] = [
+        (l, score)
+        for l, (loc_lc, vehicle_lc, make_lc, model_lc), score in zip(
+            get_transport_listings(), get_transport_search_columns(), get_transport_scores()
+        )
+        if (location_l is None or location_l is loc_lc or location_l in loc_lc)
+        and (max_price is None or l.basePrice <= max_price)
+        and (vehicle_type_l is None or vehicle_type_l == vehicle_lc)
+        and (make_l is None or make_l in make_lc)
+        and (model_l is None or model_l in model_lc)
+        and (not year or l.year == year)
+    ]
     # No matches?
     if not candidates:
-        # No exact matches – prepare suggestions from the full transport list
-        all_listings: List[Transport] = get_transport_listings()
-        # Sort by the same scoring heuristic: high rating, low price
-        suggestions_sorted = sorted(
-            all_listings,
-            key=lambda l: (-(l.averageRating * 2.0 - l.basePrice / 100.0), l.basePrice),
-        )
-        # Select up to three suggestions
-        suggestions = suggestions_sorted[:3]
+        # No exact matches – offer the precomputed top suggestions for the
+        # category (ranked by the shared scoring heuristic)
+        suggestions = mock_db.TRANSPORT_SUGGESTIONS
         # Compute reason tags for suggestions
         suggestion_data = []
         if suggestions:
-            # Determine high rating threshold and min price for suggestions
-            max_rating_all = max(l.averageRating for l in all_listings)
-            min_price_all = min(l.basePrice for l in all_listings)
+            # High rating and cheap-price thresholds are cached at import time
+            max_rating_all = mock_db.TRANSPORT_MAX_RATING
+            cheap_price = mock_db.TRANSPORT_CHEAP_PRICE
             for s in suggestions:
                 tag = "Related"
-                if s.averageRating >= 4.5 and s.averageRating >= 0.99 * max_rating_all:
+                if (
+                    s.averageRating >= HIGH_RATING_MIN
+                    and s.averageRating >= HIGH_RATING_TOLERANCE * max_rating_all
+                ):
                     tag = "High Rating"
-                elif s.basePrice <= min_price_all * 1.01:
+                elif s.basePrice <= cheap_price:
                     tag = "Cheap"
                 suggestion_data.append(
                     {
@@ -92,35 +136,59 @@ def search_transport_listings(
                         "reason": tag,
                     }
                 )
-        return {
+        result = {
             "error": "No matching transport listings found.",
             "suggestions": suggestion_data,
         }
+        return _remember(cache_key, result)
     # Select the best listing by simple heuristic (high rating, low price)
     best: Optional[Transport] = None
     best_score = float("-inf")
-    max_rating = max(l.averageRating for l in candidates)
-    for listing in candidates:
-        score = listing.averageRating * 2.0 - listing.basePrice / 100.0
+    # Track the highest rating in the same pass that picks the best listing
+    max_rating = float("-inf")
+    for listing, score in candidates:
+        if listing.averageRating > max_rating:
+            max_rating = listing.averageRating
         if score > best_score:
             best_score = score
             best = listing
     # Create a reason tag
     reason = "Best Match"
     if best:
-        if best.averageRating >= 4.5 and best.averageRating >= 0.99 * max_rating:
+        if (
+            best.averageRating >= HIGH_RATING_MIN
+            and best.averageRating >= HIGH_RATING_TOLERANCE * max_rating
+        ):
             reason = "High Rating"
         else:
-            min_price = min(l.basePrice for l in candidates)
-            if best.basePrice <= min_price * 1.01:
+            min_price = min(l.basePrice for l, _ in candidates)
+            if best.basePrice <= min_price * CHEAP_PRICE_TOLERANCE:
                 reason = "Cheap"
-    return {
+    result = {
         "listingId": best.listingId,
         "title": best.title,
         "location": best.location,
         "basePrice": best.basePrice,
         "reason": reason,
     }
+    return _remember(cache_key, result)
+
+
+def search_transport_by_query(query: str) -> Dict[str, Any]:
+    """Search for the best transport listing described in free text.
+
+    Extracts location, maximum price, vehicle type and year from the request
+    deterministically (see ``query_parser``) and runs the same search as
+    ``search_transport_listings``, so no extra LLM step is needed to pull the
+    parameters apart.
+
+    Args:
+        query: The user's request, e.g. 'a car in KL for under 100'.
+
+    Returns:
+        The same dictionary as ``search_transport_listings``.
+    """
+    return search_transport_listings(**parse_transport_query(query))
 
 
 # Define the transport agent using the ADK LlmAgent
@@ -128,17 +196,6 @@ transport_agent = LlmAgent(
     model="gemini-2.0-flash",
     name="TransportAgent",
     description="Agent specialised in finding transport/vehicle listings",
-    instruction=(
-        "You are an agent that helps users find the best **transport** listing (rental vehicle) based on their requirements.\n"
-        "When the user describes what they need (e.g. 'I need a car in KL for under 100'), follow these steps:\n"
-        "1. Extract relevant search parameters from the request: location (city or area), maximum price, vehicle type, make, model or year if specified.\n"
-        "2. Call the `search_transport_listings` function tool with the extracted parameters to retrieve the best match from the database.\n"
-        "3. If a listing is found, respond concisely with the listing's title, location, price, and a short tag in parentheses explaining why it's recommended (e.g., Cheap if it's low priced or High Rating if it has excellent reviews).\n"
-        "4. If no suitable listing is found, apologise and then present some alternative transport options from the suggestions returned by the tool. "
-        "For each suggestion, include its title, location, price and reason tag (e.g., High Rating or Cheap).\n"
-        "Do not answer queries outside of transport rentals yourself. If the user's request is unrelated to vehicles (for example, if they ask about places to stay or other items), "
-        "delegate the conversation to the appropriate agent by calling `transfer_to_agent` with 'AccommodationAgent' or 'ItemAgent' as appropriate. "
-        "This ensures the user is redirected to the right specialist."
-    ),
-    tools=[search_transport_listings],
+    instruction=TRANSPORT_INSTRUCTION,
+    tools=[search_transport_by_query, search_transport_listings],
 )